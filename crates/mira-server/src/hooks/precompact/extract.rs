@@ -136,11 +136,26 @@ pub(super) const CONTINUATION_PATTERNS: &[&str] = &[
 // Matching Helpers
 // ═══════════════════════════════════════════════════════════════════════
 
-/// Check if lowercased text matches any patterns in a keyword list.
-pub(super) fn matches_any(lower: &str, keywords: &[&str]) -> bool {
-    keywords.iter().any(|kw| lower.contains(kw))
+/// Build a single-pass matcher for a keyword list.
+///
+/// An alternation of escaped literals compiles to a multi-literal automaton,
+/// so each paragraph is scanned once rather than once per keyword.
+/// Matchers expect pre-lowered input, like the keyword lists themselves.
+#[allow(clippy::expect_used)] // Escaped literals always form a valid pattern
+fn keyword_regex(keywords: &[&str]) -> Regex {
+    let alternation = keywords
+        .iter()
+        .map(|kw| regex::escape(kw))
+        .collect::<Vec<_>>()
+        .join("|");
+    Regex::new(&alternation).expect("keyword regex")
 }
 
+pub(super) static DECISION_RE: LazyLock<Regex> = LazyLock::new(|| keyword_regex(DECISION_KEYWORDS));
+static TASK_RE: LazyLock<Regex> = LazyLock::new(|| keyword_regex(TASK_KEYWORDS));
+static FINDINGS_RE: LazyLock<Regex> = LazyLock::new(|| keyword_regex(FINDINGS_KEYWORDS));
+static ISSUE_RE: LazyLock<Regex> = LazyLock::new(|| keyword_regex(ISSUE_KEYWORDS));
+
 /// Check issue keywords only within the first ~80 chars of the paragraph.
 /// Real error reports lead with the error pattern; matching the full text
 /// produces false positives from incidental mentions.
@@ -150,7 +165,7 @@ pub(super) fn matches_issue_keyword(lower: &str) -> bool {
     } else {
         lower
     };
-    ISSUE_KEYWORDS.iter().any(|kw| prefix.contains(kw))
+    ISSUE_RE.is_match(prefix)
 }
 
 /// Check if the user's first message is a generic continuation prompt
@@ -206,6 +221,14 @@ pub(super) fn extract_file_paths(messages: &[TranscriptMessage]) -> Vec<String>
 // Context Extraction
 // ═══════════════════════════════════════════════════════════════════════
 
+/// True once every keyword-driven category has reached its cap.
+fn categories_full(ctx: &CompactionContext) -> bool {
+    ctx.decisions.len() >= MAX_ITEMS_PER_CATEGORY
+        && ctx.pending_tasks.len() >= MAX_ITEMS_PER_CATEGORY
+        && ctx.issues.len() >= MAX_ITEMS_PER_CATEGORY
+        && ctx.findings.len() >= MAX_ITEMS_PER_CATEGORY
+}
+
 /// Extract structured context from parsed transcript messages.
 ///
 /// Iterates messages in reverse so the 5-item cap captures the most recent
@@ -245,12 +268,17 @@ pub(crate) fn extract_compaction_context(messages: &[TranscriptMessage]) -> Comp
     // Reverse iteration: scan from most recent to oldest so the 5-item cap
     // captures the most recent matches. Only scan assistant messages to avoid
     // capturing user descriptions ("I decided to...") as actual decisions.
-    for msg in messages.iter().rev() {
+    // Stops as soon as every category is full, since older messages can no
+    // longer contribute.
+    'messages: for msg in messages.iter().rev() {
         if msg.role != "assistant" {
             continue;
         }
         let paragraphs: Vec<&str> = msg.text_content.split("\n\n").collect();
         for (i, paragraph) in paragraphs.iter().enumerate() {
+            if categories_full(&ctx) {
+                break 'messages;
+            }
             let trimmed = paragraph.trim();
             if trimmed.len() < MIN_CONTENT_LEN {
                 continue;
@@ -263,15 +291,11 @@ pub(crate) fn extract_compaction_context(messages: &[TranscriptMessage]) -> Comp
             };
             let lower = content.to_lowercase();
 
-            if ctx.decisions.len() < MAX_ITEMS_PER_CATEGORY
-                && matches_any(&lower, DECISION_KEYWORDS)
-            {
+            if ctx.decisions.len() < MAX_ITEMS_PER_CATEGORY && DECISION_RE.is_match(&lower) {
                 ctx.decisions.push(content.to_string());
             }
 
-            if ctx.pending_tasks.len() < MAX_ITEMS_PER_CATEGORY
-                && matches_any(&lower, TASK_KEYWORDS)
-            {
+            if ctx.pending_tasks.len() < MAX_ITEMS_PER_CATEGORY && TASK_RE.is_match(&lower) {
                 ctx.pending_tasks.push(content.to_string());
             }
 
@@ -282,8 +306,7 @@ pub(crate) fn extract_compaction_context(messages: &[TranscriptMessage]) -> Comp
             // Structured findings: capture headers/tables from expert analysis.
             // When a findings header is found, include the next paragraph too
             // (often contains the table or detail) as a single combined entry.
-            if ctx.findings.len() < MAX_ITEMS_PER_CATEGORY && matches_any(&lower, FINDINGS_KEYWORDS)
-            {
+            if ctx.findings.len() < MAX_ITEMS_PER_CATEGORY && FINDINGS_RE.is_match(&lower) {
                 let mut finding = content.to_string();
                 // Attach the following paragraph if it exists and looks like
                 // continuation content (table rows, bullets, or short detail).
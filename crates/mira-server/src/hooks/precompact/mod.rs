@@ -262,11 +262,15 @@ async fn save_pre_compaction_state(
 /// Extracts text content from `assistant` and `user` role messages,
 /// skipping `tool_use` and `tool_result` content blocks. Reuses the
 /// proven pattern from `subagent.rs`.
+///
+/// Lines that cannot carry an `assistant` or `user` role are rejected with a
+/// substring check before any JSON parsing, so large system/progress entries
+/// never get deserialized.
 pub(crate) fn parse_transcript_messages(transcript: &str) -> Vec<TranscriptMessage> {
     let mut messages = Vec::new();
     for line in transcript.lines() {
         let line = line.trim();
-        if line.is_empty() {
+        if line.is_empty() || !(line.contains("\"assistant\"") || line.contains("\"user\"")) {
             continue;
         }
         let Ok(entry) = serde_json::from_str::<serde_json::Value>(line) else {
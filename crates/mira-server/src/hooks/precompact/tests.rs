@@ -2,7 +2,7 @@
 // Tests for precompact hook: transcript parsing, context extraction, merging.
 
 use super::extract::{
-    DECISION_KEYWORDS, ISSUE_KEYWORDS, TASK_KEYWORDS, is_continuation_prompt, matches_any,
+    DECISION_KEYWORDS, DECISION_RE, ISSUE_KEYWORDS, TASK_KEYWORDS, is_continuation_prompt,
     matches_issue_keyword,
 };
 use super::*;
@@ -53,6 +53,22 @@ fn skips_system_role() {
     assert!(messages.is_empty());
 }
 
+#[test]
+fn skips_system_role_mentioning_user_in_content() {
+    // Passes the substring prefilter but must still be rejected by role
+    let transcript = r#"{"role":"system","audience":"user","content":"Ask first."}"#;
+    let messages = parse_transcript_messages(transcript);
+    assert!(messages.is_empty());
+}
+
+#[test]
+fn skips_non_message_lines_before_parsing() {
+    let transcript = "{\"type\":\"progress\",\"data\":{\"step\":1}}\n{\"role\":\"assistant\",\"content\":\"done\"}";
+    let messages = parse_transcript_messages(transcript);
+    assert_eq!(messages.len(), 1);
+    assert_eq!(messages[0].text_content, "done");
+}
+
 #[test]
 fn skips_malformed_jsonl_lines() {
     let transcript = "not json at all\n{\"role\":\"assistant\",\"content\":\"valid line\"}";
@@ -721,23 +737,23 @@ fn extracts_workaround_issue() {
     assert_eq!(ctx.issues.len(), 1);
 }
 
-// ── matches_any helper ──────────────────────────────────────────────
+// ── keyword matchers ────────────────────────────────────────────────
 
 #[test]
-fn matches_any_finds_substring() {
-    assert!(matches_any("we decided to use it", DECISION_KEYWORDS));
+fn keyword_matcher_finds_substring() {
+    assert!(DECISION_RE.is_match("we decided to use it"));
 }
 
 #[test]
-fn matches_any_returns_false_on_no_match() {
-    assert!(!matches_any("this is a normal sentence", DECISION_KEYWORDS));
+fn keyword_matcher_returns_false_on_no_match() {
+    assert!(!DECISION_RE.is_match("this is a normal sentence"));
 }
 
 #[test]
-fn matches_any_case_sensitive_on_lowered_input() {
-    // matches_any expects pre-lowered input
-    assert!(matches_any("opted for the new way", DECISION_KEYWORDS));
-    assert!(!matches_any("OPTED FOR the new way", DECISION_KEYWORDS));
+fn keyword_matcher_case_sensitive_on_lowered_input() {
+    // Keyword matchers expect pre-lowered input
+    assert!(DECISION_RE.is_match("opted for the new way"));
+    assert!(!DECISION_RE.is_match("OPTED FOR the new way"));
 }
 
 // ── Precision: should NOT match (false-positive guards) ─────────────
@@ -938,6 +954,28 @@ fn reverse_iteration_captures_most_recent() {
     assert!(ctx.decisions[4].contains("9"));
 }
 
+#[test]
+fn stops_scanning_once_all_categories_are_full() {
+    // Every message fills all four categories; the oldest must be ignored
+    let mut messages = Vec::new();
+    for i in 0..6 {
+        messages.push(TranscriptMessage {
+            role: "assistant".to_string(),
+            text_content: format!(
+                "error: case {} -- we decided to retry, todo: ship it. ## finding {}",
+                i, i
+            ),
+        });
+    }
+    let ctx = extract_compaction_context(&messages);
+    assert_eq!(ctx.decisions.len(), MAX_ITEMS_PER_CATEGORY);
+    assert_eq!(ctx.pending_tasks.len(), MAX_ITEMS_PER_CATEGORY);
+    assert_eq!(ctx.issues.len(), MAX_ITEMS_PER_CATEGORY);
+    assert_eq!(ctx.findings.len(), MAX_ITEMS_PER_CATEGORY);
+    assert!(ctx.decisions[0].contains("case 1"));
+    assert!(ctx.findings.iter().all(|f| !f.contains("case 0")));
+}
+
 #[test]
 fn reverse_iteration_restores_chronological_order() {
     let messages = vec![
@@ -1227,13 +1265,13 @@ fn issue_keyword_beyond_prefix_does_not_match() {
 
 #[test]
 fn issue_prefix_matching_does_not_affect_decision_matching() {
-    // Decisions still use full-text matching via matches_any
+    // Decisions still use full-text matching via DECISION_RE
     let messages = vec![TranscriptMessage {
         role: "assistant".to_string(),
         text_content: format!("{} we decided to change the approach.", "x".repeat(100)),
     }];
     let ctx = extract_compaction_context(&messages);
-    // Decision keyword is past 80 chars but matches_any searches the whole text
+    // Decision keyword is past 80 chars but DECISION_RE searches the whole text
     assert_eq!(ctx.decisions.len(), 1);
 }
 
@@ -148,40 +148,58 @@ pub fn sanitize_project_path(path: &str) -> String {
 /// to the database or external embedding APIs.
 #[allow(clippy::expect_used)] // Regex literals are compile-time known valid
 pub fn redact_sensitive(text: &str) -> String {
-    use regex::Regex;
+    use regex::{Regex, RegexSet};
+    use std::borrow::Cow;
     use std::sync::OnceLock;
 
-    static PATTERNS: OnceLock<Vec<Regex>> = OnceLock::new();
-    let patterns = PATTERNS.get_or_init(|| {
-        vec![
-            // API keys (OpenAI, Anthropic, etc.)
-            Regex::new(r"(?i)(sk-[a-zA-Z0-9]{20,})").expect("valid regex"),
-            Regex::new(r"(?i)(api[_-]?key\s*[=:]\s*)\S+").expect("valid regex"),
-            // Bearer tokens
-            Regex::new(r"(?i)(bearer\s+)\S+").expect("valid regex"),
-            // Connection strings with credentials
-            Regex::new(r"(?i)((?:postgres|mysql|mongodb|redis)://)[^\s]+@").expect("valid regex"),
-            // Environment variable assignments with values
-            Regex::new(r"(?i)([A-Z][A-Z0-9_]*(?:KEY|SECRET|TOKEN|PASSWORD|CREDENTIAL)[A-Z0-9_]*\s*=\s*)\S+").expect("valid regex"),
-            // Generic long hex/base64 tokens (40+ chars)
-            Regex::new(r"\b[A-Za-z0-9+/]{40,}={0,2}\b").expect("valid regex"),
-        ]
+    /// (pattern, replacement) pairs, applied in order.
+    const RULES: &[(&str, &str)] = &[
+        // API keys (OpenAI, Anthropic, etc.)
+        (r"(?i)(sk-[a-zA-Z0-9]{20,})", "sk-<REDACTED>"),
+        (r"(?i)(api[_-]?key\s*[=:]\s*)\S+", "${1}<REDACTED>"),
+        // Bearer tokens
+        (r"(?i)(bearer\s+)\S+", "${1}<REDACTED>"),
+        // Connection strings with credentials
+        (
+            r"(?i)((?:postgres|mysql|mongodb|redis)://)[^\s]+@",
+            "${1}<REDACTED>@",
+        ),
+        // Environment variable assignments with values
+        (
+            r"(?i)([A-Z][A-Z0-9_]*(?:KEY|SECRET|TOKEN|PASSWORD|CREDENTIAL)[A-Z0-9_]*\s*=\s*)\S+",
+            "${1}<REDACTED>",
+        ),
+        // Generic long hex/base64 tokens (40+ chars)
+        (r"\b[A-Za-z0-9+/]{40,}={0,2}\b", "<REDACTED_TOKEN>"),
+    ];
+
+    static PATTERNS: OnceLock<(RegexSet, Vec<Regex>)> = OnceLock::new();
+    let (set, patterns) = PATTERNS.get_or_init(|| {
+        (
+            RegexSet::new(RULES.iter().map(|(p, _)| *p)).expect("valid regex set"),
+            RULES
+                .iter()
+                .map(|(p, _)| Regex::new(p).expect("valid regex"))
+                .collect(),
+        )
     });
 
-    let mut result = text.to_string();
-    for (i, pattern) in patterns.iter().enumerate() {
-        let replacement = match i {
-            0 => "sk-<REDACTED>",
-            1 => "${1}<REDACTED>",
-            2 => "${1}<REDACTED>",
-            3 => "${1}<REDACTED>@",
-            4 => "${1}<REDACTED>",
-            5 => "<REDACTED_TOKEN>",
-            _ => "<REDACTED>",
+    // Most inputs contain nothing sensitive: one combined scan decides that
+    // without running each pattern separately.
+    if !set.is_match(text) {
+        return text.to_string();
+    }
+
+    // Only allocate when a pattern actually replaced something
+    let mut result = Cow::Borrowed(text);
+    for (pattern, (_, replacement)) in patterns.iter().zip(RULES) {
+        let replaced = match pattern.replace_all(&result, *replacement) {
+            Cow::Borrowed(_) => continue,
+            Cow::Owned(s) => s,
         };
-        result = pattern.replace_all(&result, replacement).into_owned();
+        result = Cow::Owned(replaced);
     }
-    result
+    result.into_owned()
 }
 
 /// Format a `since_days` filter into a human-readable period string.
@@ -411,6 +429,15 @@ mod tests {
         assert!(!result.contains("longsecretvalue"));
     }
 
+    #[test]
+    fn test_redact_multiple_kinds_in_one_input() {
+        let input = "Bearer abc.def.ghi failed for mysql://root:hunter2@db:3306/app";
+        let result = redact_sensitive(input);
+        assert!(!result.contains("abc.def.ghi"));
+        assert!(!result.contains("hunter2"));
+        assert!(result.contains("mysql://<REDACTED>@"));
+    }
+
     #[test]
     fn test_normalize_project_path_strips_trailing_slash() {
         let result = normalize_project_path("/tmp/test/");